@@ -5,18 +5,48 @@ Usage: python generate_resume.py
 """
 
 import yaml
-from jinja2 import Template
-from weasyprint import HTML
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from markupsafe import Markup
+import hashlib
 import os
 import re
 
+# Use libyaml's C parser when available; falls back to the pure-Python loader
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# The same short strings (tech names, orgs) recur across sections and saves
+@lru_cache(maxsize=1024)
 def parse_markdown_links(text):
     """Convert Markdown-style links [text](url) to HTML <a> tags."""
-    if not text:
+    # Most fields carry no link at all; skip the scan for them
+    if not text or '[' not in text:
+        return text
+    # Scan for [text](url) with str.find rather than a backtracking regex
+    parts = []
+    pos = 0
+    i = text.find('[')
+    while i != -1:
+        j = text.find(']', i + 1)
+        if j == -1:
+            break
+        k = text.find(')', j + 2) if text.startswith('(', j + 1) else -1
+        if j == i + 1 or k <= j + 2:
+            # Not a link here; retry from the next '[' like the regex would
+            i = text.find('[', i + 1)
+            continue
+        parts.append(text[pos:i])
+        parts.append(f'<a href="{text[j + 2:k]}">{text[i + 1:j]}</a>')
+        pos = k + 1
+        i = text.find('[', pos)
+    if not parts:
         return text
-    # Regex to match [text](url)
-    pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-    return re.sub(pattern, r'<a href="\2">\1</a>', text)
+    parts.append(text[pos:])
+    # Mark the generated <a> tags as safe so templates need no "| safe"
+    return Markup(''.join(parts))
+
+_HYPHEN_TABLE = str.maketrans({'-': '–'})
 
 def convert_hyphens(text):
     """
@@ -25,205 +55,205 @@ def convert_hyphens(text):
 
     This is applied specifically to date fields.
     """
-    if not text:
-        return text
-    # Replace single hyphen-minus with en dash, but only if preceded/followed by a word character
-    # (to avoid replacing hyphens in compound words unnecessarily, though dates are the primary target).
     # A simple replacement for date ranges should be sufficient and safe.
-    return text.replace('-', '–')
+    return text.translate(_HYPHEN_TABLE) if text else text
+
+# CSS matching your current resume style
+_CSS_TEXT = """
+@page {
+    size: letter;
+    margin: 0;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: "Helvetica Neue", Helvetica, Arial, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+    font-size: 11pt;
+    line-height: 1.4;
+    color: #000;
+    margin: 0.75in 0.75in;
+}
+
+.header {
+    text-align: center;
+    margin-bottom: 8pt;
+}
+
+.header h1 {
+    font-size: 16pt;
+    font-weight: 700;
+    margin-bottom: 2pt;
+    letter-spacing: 0.02em;
+}
+
+.header .contact {
+    font-size: 11pt;
+    font-weight: 400;
+}
+
+.section {
+    margin-bottom: 10pt;
+}
+
+.section-title {
+    font-size: 11pt;
+    font-weight: 700;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+    margin-bottom: 4pt;
+    padding-bottom: 2pt;
+    border-bottom: 0.5pt solid #000;
+}
+
+a {
+    color: #000;
+    text-decoration: none;
+    border-bottom: 1px dotted #999;
+}
+
+a:hover {
+    background-color: #f0f0f0;
+}
+
+/* --- SKILLS SECTION FIX --- */
+.skills-list {
+    /* Now an actual unordered list for proper bullet control */
+    list-style: disc;
+    /* Indent the whole list slightly for visual space */
+    margin-left: 10pt;
+    padding-left: 0;
+    list-style-position: outside; /* Ensure wrapped text aligns correctly */
+}
+
+.skill-item {
+    margin-bottom: 3pt;
+    /* Using list-style takes care of the indent automatically */
+    margin-left: 10pt;
+    padding-left: 0;
+}
+/* -------------------------- */
+
+.experience-item, .education-item, .project-item {
+    margin-bottom: 8pt;
+}
+
+.company-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    margin-bottom: 0pt;
+    font-weight: 600;
+}
+
+.company-name {
+    font-weight: 600;
+}
+
+.company-dates {
+    font-weight: 400;
+    font-style: italic;
+}
+
+.role-item {
+    margin-left: 0;
+    margin-bottom: 4pt;
+}
+
+.role-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    font-weight: 400;
+    margin-top: 1pt;
+}
+
+.role-dates {
+    font-style: italic;
+    font-weight: 400;
+    font-size: 10pt;
+}
+
+.responsibilities {
+    margin-left: 12pt;
+    margin-top: 1pt;
+}
+
+.responsibilities li {
+    margin-bottom: 1pt;
+}
+
+.project-header {
+    margin-bottom: 1pt;
+}
+
+.project-name {
+    font-weight: 600;
+    display: inline;
+}
+
+.project-tech {
+    font-style: italic;
+    display: inline;
+}
+
+.project-url {
+    float: right;
+    font-style: italic;
+}
+
+.coursework {
+    margin-left: 12pt;
+}
+
+.education-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    margin-bottom: 1pt;
+}
+
+.institution {
+    font-weight: 600;
+}
+
+.degree-line {
+    margin-bottom: 1pt;
+}
+"""
 
-# HTML/CSS template matching your current resume style
-TEMPLATE = """
+# HTML template, split into sections so unchanged ones can be reused between
+# renders. Each entry is (name, top-level YAML keys it reads, template source);
+# the stylesheet above is applied separately.
+TEMPLATE_SECTIONS = [
+    ('header', ('name', 'location', 'email', 'website'), """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
     <title>Maximillian V. Phillips</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        @page {
-            size: letter;
-            margin: 0;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: "Helvetica Neue", Helvetica, Arial, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-            font-size: 11pt;
-            line-height: 1.4;
-            color: #000;
-            margin: 0.75in 0.75in;
-        }
-
-        .header {
-            text-align: center;
-            margin-bottom: 8pt;
-        }
-
-        .header h1 {
-            font-size: 16pt;
-            font-weight: 700;
-            margin-bottom: 2pt;
-            letter-spacing: 0.02em;
-        }
-
-        .header .contact {
-            font-size: 11pt;
-            font-weight: 400;
-        }
-
-        .section {
-            margin-bottom: 10pt;
-        }
-
-        .section-title {
-            font-size: 11pt;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            margin-bottom: 4pt;
-            padding-bottom: 2pt;
-            border-bottom: 0.5pt solid #000;
-        }
-
-        a {
-            color: #000;
-            text-decoration: none;
-            border-bottom: 1px dotted #999;
-        }
-
-        a:hover {
-            background-color: #f0f0f0;
-        }
-
-        /* --- SKILLS SECTION FIX --- */
-        .skills-list {
-            /* Now an actual unordered list for proper bullet control */
-            list-style: disc;
-            /* Indent the whole list slightly for visual space */
-            margin-left: 10pt;
-            padding-left: 0;
-            list-style-position: outside; /* Ensure wrapped text aligns correctly */
-        }
-
-        .skill-item {
-            margin-bottom: 3pt;
-            /* Using list-style takes care of the indent automatically */
-            margin-left: 10pt;
-            padding-left: 0;
-        }
-        /* -------------------------- */
-
-        .experience-item, .education-item, .project-item {
-            margin-bottom: 8pt;
-        }
-
-        .company-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: baseline;
-            margin-bottom: 0pt;
-            font-weight: 600;
-        }
-
-        .company-name {
-            font-weight: 600;
-        }
-
-        .company-dates {
-            font-weight: 400;
-            font-style: italic;
-        }
-
-        .role-item {
-            margin-left: 0;
-            margin-bottom: 4pt;
-        }
-
-        .role-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: baseline;
-            font-weight: 400;
-            margin-top: 1pt;
-        }
-
-        .role-dates {
-            font-style: italic;
-            font-weight: 400;
-            font-size: 10pt;
-        }
-
-        .responsibilities {
-            margin-left: 12pt;
-            margin-top: 1pt;
-        }
-
-        .responsibilities li {
-            margin-bottom: 1pt;
-        }
-
-        .project-header {
-            margin-bottom: 1pt;
-        }
-
-        .project-name {
-            font-weight: 600;
-            display: inline;
-        }
-
-        .project-tech {
-            font-style: italic;
-            display: inline;
-        }
-
-        .project-url {
-            float: right;
-            font-style: italic;
-        }
-
-        .coursework {
-            margin-left: 12pt;
-        }
-
-        .education-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: baseline;
-            margin-bottom: 1pt;
-        }
-
-        .institution {
-            font-weight: 600;
-        }
-
-        .degree-line {
-            margin-bottom: 1pt;
-        }
-    </style>
 </head>
 <body>
     <div class="header">
         <h1>{{ name }}</h1>
-        <div class="contact">{{ parse_links(location) }} — {{ parse_links(email) | safe }} — {{ parse_links(website) | safe }}</div>
+        <div class="contact">{{ location }} — {{ email }} — {{ website }}</div>
     </div>
-
+"""),
+    ('skills', ('skills',), """
     <div class="section">
         <div class="section-title">Skills</div>
         <ul class="skills-list">
             {% for skill in skills %}
-            <li class="skill-item"><strong>{{ skill.category }}:</strong> {% for item in skill.get('items', []) %}{{ parse_links(item) | safe }}{% if not loop.last %}, {% endif %}{% endfor %}</li>
+            <li class="skill-item"><strong>{{ skill.category }}:</strong> {% for item in skill.get('items', []) %}{{ item }}{% if not loop.last %}, {% endif %}{% endfor %}</li>
             {% endfor %}
         </ul>
     </div>
-
+"""),
+    ('experience', ('experience',), """
     <div class="section">
         <div class="section-title">Experience</div>
         {% for job in experience %}
@@ -231,13 +261,13 @@ TEMPLATE = """
             {% for role in job.roles %}
             <div class="role-item">
                 <div class="role-header">
-                    <span style="font-weight: 600;">{{ parse_links(role.title) | safe }}</span>
-                    <span class="role-dates">{{ convert_hyphens(role.dates) }}</span>
+                    <span style="font-weight: 600;">{{ role.title }}</span>
+                    <span class="role-dates">{{ role.dates }}</span>
                 </div>
-                <div style="margin-bottom: 2pt;">{{ parse_links(job.company) | safe }} • {{ job.location }}</div>
+                <div style="margin-bottom: 2pt;">{{ job.company }} • {{ job.location }}</div>
                 <ul class="responsibilities">
                     {% for resp in role.responsibilities %}
-                    <li>{{ parse_links(resp) | safe }}</li>
+                    <li>{{ resp }}</li>
                     {% endfor %}
                 </ul>
             </div>
@@ -245,48 +275,246 @@ TEMPLATE = """
         </div>
         {% endfor %}
     </div>
-
+"""),
+    ('awards', ('awards',), """
     <div class="section">
         <div class="section-title">Awards</div>
         {% for award in awards %}
         <div class="experience-item">
             <div class="role-header">
-                <span style="font-weight: 600;">{{ parse_links(award.name) | safe }}</span>
-                <span class="role-dates">{{ convert_hyphens(award.date) }}</span>
+                <span style="font-weight: 600;">{{ award.name }}</span>
+                <span class="role-dates">{{ award.date }}</span>
             </div>
-            <div style="margin-bottom: 2pt;">{{ parse_links(award.organization) | safe }}{% if award.team %} • {{ award.team }}{% endif %}</div>
+            <div style="margin-bottom: 2pt;">{{ award.organization }}{% if award.team %} • {{ award.team }}{% endif %}</div>
             {% if award.description %}
             <ul class="responsibilities">
-                <li>{{ parse_links(award.description) | safe }}</li>
+                <li>{{ award.description }}</li>
             </ul>
             {% endif %}
         </div>
         {% endfor %}
     </div>
-
+"""),
+    ('education', ('education',), """
     <div class="section">
         <div class="section-title">Education</div>
         {% for edu in education %}
         <div class="education-item">
             <div class="education-header">
-                <span class="institution">{{ parse_links(edu.degree) | safe }}</span>
-                <span style="font-style: italic;">{{ convert_hyphens(edu.graduation) }}</span>
+                <span class="institution">{{ edu.degree }}</span>
+                <span style="font-style: italic;">{{ edu.graduation }}</span>
             </div>
-            <div style="margin-bottom: 2pt;">{{ parse_links(edu.institution) | safe }}{% if edu.gpa %} • {{ edu.gpa }}{% endif %}</div>
+            <div style="margin-bottom: 2pt;">{{ edu.institution }}{% if edu.gpa %} • {{ edu.gpa }}{% endif %}</div>
             {% if edu.coursework %}
             <div class="coursework">
-                <strong>• Coursework:</strong> {% for course in edu.coursework %}{{ parse_links(course) | safe }}{% if not loop.last %}, {% endif %}{% endfor %}
+                <strong>• Coursework:</strong> {% for course in edu.coursework %}{{ course }}{% if not loop.last %}, {% endif %}{% endfor %}
             </div>
             {% endif %}
         </div>
         {% endfor %}
     </div>
+"""),
+    ('footer', (), """
 </body>
 </html>
-"""
+"""),
+]
+
+def _bytecode_cache():
+    """Cache compiled templates on disk so restarts skip Jinja's compile step."""
+    # Section names are generic, so keep each checkout of this script apart
+    script_key = hashlib.blake2b(
+        os.path.abspath(__file__).encode('utf-8'), digest_size=8).hexdigest()
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'resume-jinja', script_key)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    # Jinja writes the cache while compiling at import, so an existing but
+    # read-only directory would otherwise make the import fail
+    if not os.access(cache_dir, os.R_OK | os.W_OK | os.X_OK):
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+# Compile the templates once at import; watch mode re-renders them on every save.
+# Fields are pre-converted by _transform(); the filters remain for template edits.
+# Templates are loaded by name so the bytecode cache has stable keys
+_ENV = Environment(
+    loader=DictLoader({name: source for name, _, source in TEMPLATE_SECTIONS}),
+    bytecode_cache=_bytecode_cache(),
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_ENV.filters['parse_links'] = parse_markdown_links
+_ENV.filters['dashes'] = convert_hyphens
+_SECTIONS = [(name, keys, _ENV.get_template(name)) for name, keys, _ in TEMPLATE_SECTIONS]
+
+# Last rendered fragment per section, keyed by a hash of the data it read
+_FRAGMENT_CACHE = {}
+
+# CSS tokens the minifier cares about: quoted strings (kept verbatim),
+# comments, punctuation that needs no surrounding space, and whitespace runs
+_CSS_TOKEN_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')'
+    r'|\s*/\*.*?\*/\s*'
+    r'|\s*([{};,])\s*'
+    r'|\s+',
+    re.S,
+)
+
+def _minify_css_token(match):
+    string, punctuation = match.groups()
+    if string is not None:
+        return string
+    if punctuation is not None:
+        return punctuation
+    # Whitespace and comments still separate tokens (e.g. descendant selectors)
+    return ' '
+
+def _minify_css(css):
+    """Strip comments and insignificant whitespace from CSS, leaving strings intact."""
+    return _CSS_TOKEN_RE.sub(_minify_css_token, css).strip()
+
+_CSS_MIN = _minify_css(_CSS_TEXT)
+_STYLE_TAG = f"<style>{_CSS_MIN}</style>\n"
+_CACHE = {}
+_URL_MEMO = {}
+
+@lru_cache(maxsize=None)
+def _weasyprint():
+    """
+    Import WeasyPrint on first use and build the shared stylesheet, fonts and
+    URL fetcher.
 
-def generate_resume(yaml_file='resume.yaml', output_pdf='resume.pdf', output_html='resume.html'):
-    """Generate PDF and HTML resume from YAML file."""
+    WeasyPrint pulls in cairo, pango and friends, so deferring it keeps the
+    watcher's startup and HTML-only runs cheap.
+    """
+    from weasyprint import CSS, HTML, URLFetcher
+    from weasyprint.text.fonts import FontConfiguration
+    from weasyprint.urls import URLFetcherResponse
+
+    class MemoURLFetcher(URLFetcher):
+        """URL fetcher that remembers remote resources across renders."""
+
+        def fetch(self, url, headers=None):
+            # Local files may be edited while watching, so always re-read them
+            if url.lower().startswith('file:'):
+                return super().fetch(url, headers)
+            if url not in _URL_MEMO:
+                response = super().fetch(url, headers)
+                try:
+                    body = response.read()
+                finally:
+                    response.close()
+                _URL_MEMO[url] = (response.url, body, response.headers, response.status)
+            # Responses are consumed once, so hand out a fresh one each time
+            return URLFetcherResponse(*_URL_MEMO[url])
+
+    font_config = FontConfiguration()
+    url_fetcher = MemoURLFetcher()
+    css = CSS(string=_CSS_MIN, font_config=font_config, url_fetcher=url_fetcher)
+    return HTML, css, font_config, url_fetcher
+
+# Hash of the last successfully written output, used to skip no-op rebuilds
+_LAST_HTML_HASH = None
+
+def _apply(item, key, func):
+    """Replace item[key] with func(item[key]) if the key is present."""
+    if key in item:
+        item[key] = func(item[key])
+
+def _apply_each(item, key, func):
+    """Apply func to every entry of the list at item[key], if any."""
+    if item.get(key):
+        item[key] = [func(x) for x in item[key]]
+
+def _transform(data):
+    """Convert links and date hyphens in the resume data before rendering."""
+    for key in ('location', 'email', 'website'):
+        _apply(data, key, parse_markdown_links)
+    for skill in data.get('skills') or []:
+        _apply_each(skill, 'items', parse_markdown_links)
+    for job in data.get('experience') or []:
+        _apply(job, 'company', parse_markdown_links)
+        for role in job.get('roles') or []:
+            _apply(role, 'title', parse_markdown_links)
+            _apply(role, 'dates', convert_hyphens)
+            _apply_each(role, 'responsibilities', parse_markdown_links)
+    for award in data.get('awards') or []:
+        for key in ('name', 'organization', 'description'):
+            _apply(award, key, parse_markdown_links)
+        _apply(award, 'date', convert_hyphens)
+    for edu in data.get('education') or []:
+        for key in ('degree', 'institution'):
+            _apply(edu, key, parse_markdown_links)
+        _apply(edu, 'graduation', convert_hyphens)
+        _apply_each(edu, 'coursework', parse_markdown_links)
+    return data
+
+def _render_html(data, skip=()):
+    """Render the resume HTML, reusing fragments for unchanged sections."""
+    fragments = []
+    for name, keys, template in _SECTIONS:
+        if name in skip:
+            continue
+        # Leave missing keys out so the template sees them as undefined
+        context = {key: data[key] for key in keys if key in data}
+        key = hashlib.blake2b(repr(context).encode('utf-8'), digest_size=16).hexdigest()
+        cached = _FRAGMENT_CACHE.get(name)
+        if cached and cached[0] == key:
+            fragments.append(cached[1])
+            continue
+        fragment = template.render(**context)
+        _FRAGMENT_CACHE[name] = (key, fragment)
+        fragments.append(fragment)
+    return ''.join(fragments)
+
+def _write_html(output_html, html_content):
+    """Write the HTML resume, returning True on success."""
+    try:
+        # Inline the stylesheet so the exported HTML stands on its own
+        html_bytes = html_content.replace('</head>', _STYLE_TAG + '</head>', 1).encode('utf-8')
+        try:
+            with open(output_html, 'rb') as f:
+                unchanged = f.read() == html_bytes
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            print(f"✓ HTML unchanged: {output_html}")
+        else:
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_html = output_html + '.tmp'
+            with open(tmp_html, 'wb') as f:
+                f.write(html_bytes)
+            os.replace(tmp_html, output_html)
+            print(f"✓ HTML generated: {output_html}")
+        return True
+    except Exception as e:
+        print(f"Error generating HTML: {e}")
+        return False
+
+def _write_pdf(output_pdf, html_content):
+    """Render the PDF resume, returning True on success."""
+    try:
+        HTML, css, font_config, url_fetcher = _weasyprint()
+        HTML(string=html_content, url_fetcher=url_fetcher).write_pdf(
+            output_pdf, stylesheets=[css], font_config=font_config, cache=_CACHE)
+        print(f"✓ PDF generated: {output_pdf}")
+        return True
+    except Exception as e:
+        print(f"Error generating PDF: {e}")
+        return False
+
+def generate_resume(yaml_file='resume.yaml', output_pdf='resume.pdf', output_html='resume.html',
+                    include_awards=True):
+    """
+    Generate PDF and HTML resume from YAML file.
+
+    Pass output_pdf=None or output_html=None to skip that file, and
+    include_awards=False to leave the Awards section out of both outputs.
+    """
+    global _LAST_HTML_HASH
 
     if not os.path.exists(yaml_file):
         print(f"Error: {yaml_file} not found. Please create the file first.")
@@ -295,33 +523,33 @@ def generate_resume(yaml_file='resume.yaml', output_pdf='resume.pdf', output_htm
     # Load YAML data
     try:
         with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=Loader)
     except yaml.YAMLError as e:
         print(f"Error parsing YAML: {e}")
         return
 
     # Render template
-    template = Template(TEMPLATE)
-    # Add the custom functions to Jinja2 environment
-    template.globals['parse_links'] = parse_markdown_links
-    template.globals['convert_hyphens'] = convert_hyphens
-
-    html_content = template.render(**data)
-
-    # Generate HTML file
-    try:
-        with open(output_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"✓ HTML generated: {output_html}")
-    except Exception as e:
-        print(f"Error generating HTML: {e}")
+    html_content = _render_html(_transform(data), skip=() if include_awards else ('awards',))
+
+    # Skip both outputs if nothing rendered differently since the last run
+    html_hash = hashlib.blake2b(
+        f"{output_pdf}\0{output_html}\0{html_content}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    if html_hash == _LAST_HTML_HASH:
+        print("✓ No changes to rendered resume, skipping")
+        return
 
-    # Generate PDF
-    try:
-        HTML(string=html_content).write_pdf(output_pdf)
-        print(f"✓ PDF generated: {output_pdf}")
-    except Exception as e:
-        print(f"Error generating PDF: {e}")
+    # Write both outputs concurrently; WeasyPrint's layout dominates anyway
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = []
+        if output_pdf is not None:
+            futures.append(executor.submit(_write_pdf, output_pdf, html_content))
+        if output_html is not None:
+            futures.append(executor.submit(_write_html, output_html, html_content))
+        ok = all([future.result() for future in futures])
+
+    if ok:
+        _LAST_HTML_HASH = html_hash
 
 if __name__ == '__main__':
     generate_resume()
\ No newline at end of file
@@ -4,22 +4,57 @@ Resume Watcher - Auto-regenerate PDF when YAML changes
 Usage: python watch_resume.py
 """
 
+import os
+import threading
 import time
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from generate_resume import generate_resume
 
-class ResumeHandler(FileSystemEventHandler):
-    def __init__(self):
-        self.last_modified = time.time()
-    
+class ResumeHandler(PatternMatchingEventHandler):
+    def __init__(self, debounce=0.4):
+        # Let watchdog drop events for every other file in the directory
+        super().__init__(patterns=['resume.yaml', '*/resume.yaml'], ignore_directories=True)
+        # Editors emit several events per save; regenerate once they settle
+        self.debounce = debounce
+        self._timer = None
+        self._lock = threading.Lock()
+        # Timers fire on their own threads; never run two generations at once
+        self._run_lock = threading.Lock()
+        self._last_stat = None
+
     def on_modified(self, event):
-        # Debounce: ignore rapid successive saves
-        if time.time() - self.last_modified < 0.5:
-            return
-        
-        if event.src_path.endswith('resume.yaml'):
-            self.last_modified = time.time()
+        self._schedule()
+
+    def on_created(self, event):
+        self._schedule()
+
+    def on_moved(self, event):
+        # Atomic saves write a temp file and rename it over resume.yaml;
+        # renaming resume.yaml away (e.g. to a backup) is not a change
+        if os.path.basename(event.dest_path) == 'resume.yaml':
+            self._schedule()
+
+    def _schedule(self):
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self):
+        with self._run_lock:
+            # Skip touch/chmod/metadata-only events that leave the file as it was
+            try:
+                st = os.stat('resume.yaml')
+            except FileNotFoundError:
+                return
+            key = (st.st_mtime_ns, st.st_size)
+            if key == self._last_stat:
+                return
+            self._last_stat = key
+
             print(f"\n[{time.strftime('%H:%M:%S')}] Detected change in resume.yaml")
             try:
                 generate_resume()